@@ -10,5 +10,9 @@ schedule.every().day.at("18:58").do(main)  # Run daily at midnight
 if __name__ == "__main__":
     print("Scheduler is running... Press Ctrl+C to exit.")
     while True:
-        schedule.run_pending()
-        time.sleep(1)
\ No newline at end of file
+        # Sleep until the next job is due, capped at a minute so DST changes and host suspends don't delay it
+        idle = schedule.idle_seconds()
+        if idle is None:
+            break  # No jobs scheduled
+        time.sleep(min(max(idle, 0), 60))
+        schedule.run_pending()
\ No newline at end of file